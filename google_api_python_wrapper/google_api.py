@@ -6,7 +6,11 @@ import sys
 from pathlib import Path
 from typing import Optional, Tuple, Any
 
+import httplib2
+from concurrent.futures import ThreadPoolExecutor
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.discovery_cache.base import Cache as DiscoveryCacheBase
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -16,6 +20,13 @@ from googleapiclient.errors import HttpError
 
 from dataclasses import dataclass
 
+try:
+    # C-accelerated JSON for the token file (2-5x faster parse/dump);
+    # stdlib json remains the fallback, as in core.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
 
 # ---- Edit scopes once ----
 SCOPES = [
@@ -51,11 +62,22 @@ def _token_dir() -> Path:
 def _token_path(stem: str) -> Path:
     return _token_dir() / f"{stem}.json"
 
+# In-process credentials cache keyed by (token stem, scope set): within one
+# process the token on disk rarely changes, so after the first load we skip
+# the stat + read + JSON parse and just check validity in memory.
+_CRED_CACHE: dict = {}
+
+
 def _load_token(stem: str) -> Optional[Credentials]:
+    key = (stem, frozenset(SCOPES))
+    cached = _CRED_CACHE.get(key)
+    if cached is not None and cached.valid:
+        return cached
     p = _token_path(stem)
     if not p.exists():
         return None
-    data = json.loads(p.read_text())
+    raw = p.read_bytes()
+    data = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
     creds = Credentials(
         token=data.get("token"),
         refresh_token=data.get("refresh_token"),
@@ -70,7 +92,9 @@ def _load_token(stem: str) -> Optional[Credentials]:
             _save_token(stem, creds)
         except Exception:
             # Refresh failed (revoked/changed password/etc). Force re-consent.
+            _CRED_CACHE.pop(key, None)
             return None
+    _CRED_CACHE[key] = creds
     return creds
 
 def _save_token(stem: str, creds: Credentials) -> None:
@@ -82,7 +106,14 @@ def _save_token(stem: str, creds: Credentials) -> None:
         "client_secret": creds.client_secret,
         "scopes": creds.scopes,
     }
-    _token_path(stem).write_text(json.dumps(payload))
+    _CRED_CACHE[(stem, frozenset(SCOPES))] = creds
+    p = _token_path(stem)
+    # Write-then-rename: a crash mid-write can no longer truncate the token
+    # file and force a full re-consent.
+    tmp = p.with_name(p.name + ".tmp")
+    blob = _orjson.dumps(payload) if _orjson is not None else json.dumps(payload).encode("utf-8")
+    tmp.write_bytes(blob)
+    os.replace(tmp, p)
 
 def _client_secrets_from_env(env_var: str = ENV_CLIENT_INFO) -> Optional[dict]:
     raw = os.getenv(env_var)
@@ -183,6 +214,112 @@ def get_oauth_credentials(
 
 
 
+class _FileDiscoveryCache(DiscoveryCacheBase):
+    """
+    File-backed cache for API discovery documents so each document is fetched
+    at most once per machine (used only when the library has no bundled copy).
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self._dir = cache_dir or (Path.home() / ".cache" / "google_api_python_wrapper" / "discovery")
+
+    def _path(self, url: str) -> Path:
+        import hashlib
+        return self._dir / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, url):
+        try:
+            return self._path(url).read_text()
+        except OSError:
+            return None
+
+    def set(self, url, content):
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._path(url).write_text(content)
+        except OSError:
+            pass  # cache is best-effort
+
+
+_DISCOVERY_CACHE = _FileDiscoveryCache()
+
+
+def authorized_http(creds: Credentials) -> AuthorizedHttp:
+    """
+    Build a keep-alive HTTP transport bound to `creds`.
+
+    A single pooled `httplib2.Http` is reused across every request made through
+    it, so the TCP+TLS handshake is paid once instead of once per API call.
+    Note: `httplib2.Http` is NOT thread-safe — create one transport per thread
+    (call this again) when issuing concurrent requests.
+    """
+    return AuthorizedHttp(creds, http=httplib2.Http(timeout=30))
+
+
+_SERVICE_SPECS = (
+    ("drive", "v3"),
+    ("docs", "v1"),
+    ("sheets", "v4"),
+    ("calendar", "v3"),
+    ("tasks", "v1"),
+    ("forms", "v1"),
+    ("gmail", "v1"),
+)
+
+
+class _LazyServices:
+    """
+    Lazy namespace over the 7 service clients.
+
+    Most workloads touch only one or two services, so each client is built on
+    first attribute access (e.g. ``services.drive``) and memoized. Iterating
+    yields the clients in the historical tuple order — so existing
+    ``drive, docs, ... = services`` unpacking keeps working — and materializes
+    any still-missing clients on a thread pool to overlap the disk reads of
+    the bundled discovery docs.
+    """
+
+    __slots__ = ("_creds", "_http", "_clients")
+
+    _VERSIONS = dict(_SERVICE_SPECS)
+
+    def __init__(self, creds: Credentials) -> None:
+        self._creds = creds
+        self._http = None  # shared keep-alive transport, created on first build
+        self._clients: dict = {}
+
+    def _build(self, name: str, ver: str):
+        if self._http is None:
+            self._http = authorized_http(self._creds)
+        return build(name, ver, http=self._http, cache_discovery=True,
+                     cache=_DISCOVERY_CACHE, static_discovery=True)
+
+    def __getattr__(self, name: str):
+        ver = self._VERSIONS.get(name)
+        if ver is None:
+            raise AttributeError(f"{type(self).__name__} has no service {name!r}")
+        client = self._clients.get(name)
+        if client is None:
+            client = self._clients[name] = self._build(name, ver)
+        return client
+
+    def __iter__(self):
+        missing = [(n, v) for n, v in _SERVICE_SPECS if n not in self._clients]
+        if len(missing) > 1:
+            if self._http is None:
+                self._http = authorized_http(self._creds)  # before the pool; creation is not thread-safe
+            with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+                futures = [(n, ex.submit(self._build, n, v)) for n, v in missing]
+                for n, f in futures:
+                    self._clients[n] = f.result()
+        return (getattr(self, name) for name, _ in _SERVICE_SPECS)
+
+
+def _build_services(creds: Credentials) -> Tuple:
+    """Eagerly build all 7 clients (kept for callers that want the old tuple)."""
+    return tuple(_LazyServices(creds))
+
+
 def get_google_services_oauth(
     *,
     oauth_client_file: Optional[str] = None,
@@ -190,29 +327,26 @@ def get_google_services_oauth(
     interactive: Optional[bool] = None,
 ) -> Tuple:
     """
-    Returns Drive, Docs, Sheets, Calendar, Tasks, Forms clients using OAuth.
+    Returns the Drive, Docs, Sheets, Calendar, Tasks, Forms, Gmail clients
+    using OAuth, as a lazy namespace: ``services.drive`` etc. build on first
+    use, and tuple unpacking in the historical order still works.
     Auto-detects Colab and uses Colab auth unless you provide client info.
+    All clients share one keep-alive transport (see `authorized_http`).
     """
     creds = get_oauth_credentials(
         oauth_client_file=oauth_client_file,
         oauth_token_stem=oauth_token_stem,
         interactive=interactive,
     )
-    drive    = build("drive",    "v3", credentials=creds)
-    docs     = build("docs",     "v1", credentials=creds)
-    sheets   = build("sheets",   "v4", credentials=creds)
-    calendar = build("calendar", "v3", credentials=creds)
-    tasks    = build("tasks",    "v1", credentials=creds)
-    forms    = build("forms",    "v1", credentials=creds)
-    gmail = build("gmail", "v1", credentials=creds)
-    return drive, docs, sheets, calendar, tasks, forms, gmail
+    return _LazyServices(creds)
 
 @dataclass
 class GoogleAuthResult:
     """Outcome of attempting to create Google API service clients."""
-    services: Optional[Tuple[Any, ...]] = None
+    services: Optional[Any] = None  # _LazyServices (iterable in the old tuple order)
     auth_failed: bool = False          # True if auth failed for any reason
     error: Optional[Exception] = None  # Non-auth error that occurred (if any)
+    credentials: Optional[Credentials] = None  # creds behind `services` (for per-thread transports)
 
     @property
     def ok(self) -> bool:
@@ -227,17 +361,28 @@ def try_get_google_services_oauth(
 ) -> GoogleAuthResult:
     """
     Wraps get_google_services_oauth:
-      - Returns GoogleAuthResult with auth_failed=True if authentication failed
-        (i.e., underlying helper returned None).
-      - Captures any non-auth exceptions in .error and also marks auth_failed=True.
+      - Returns GoogleAuthResult with auth_failed=True when the credentials
+        themselves are the problem (RefreshError, missing client secrets, ...).
+      - Transient failures (HttpError, network/timeout) come back with
+        auth_failed=False so callers can retry with backoff instead of
+        re-running the expensive interactive OAuth flow.
+      - Either way the exception is attached as .error.
     """
     try:
-        services = get_google_services_oauth(
+        creds = get_oauth_credentials(
             oauth_client_file=oauth_client_file,
             oauth_token_stem=oauth_token_stem,
             interactive=interactive,
         )
-        return GoogleAuthResult(services=services, auth_failed=False, error=None)
+        services = _LazyServices(creds)
+        return GoogleAuthResult(services=services, auth_failed=False, error=None, credentials=creds)
+    except RefreshError as e:
+        # Token revoked/expired beyond refresh — genuinely needs re-consent.
+        return GoogleAuthResult(services=None, auth_failed=True, error=e)
+    except (HttpError, ConnectionError, TimeoutError, httplib2.HttpLib2Error) as e:
+        # Transient network/server trouble: retriable without re-auth.
+        return GoogleAuthResult(services=None, auth_failed=False, error=e)
     except Exception as e:
-        # Non-auth failure (e.g., network, misconfig). Flag and attach error.
+        # Anything else (misconfig, missing client file, ...): treat as auth
+        # failure so it surfaces instead of being retried forever.
         return GoogleAuthResult(services=None, auth_failed=True, error=e)
\ No newline at end of file